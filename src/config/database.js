@@ -10,6 +10,14 @@ const sequelize = new Sequelize(
     port: process.env.DB_PORT,
     dialect: 'mysql',
     logging: process.env.NODE_ENV === 'development' ? console.log : false,
+    // Default pool max is 5, which serializes concurrent requests under
+    // load; size it for the deployment via env vars
+    pool: {
+      max: parseInt(process.env.DB_POOL_MAX, 10) || 20,
+      min: parseInt(process.env.DB_POOL_MIN, 10) || 0,
+      acquire: 30000,
+      idle: 10000
+    },
     define: {
       timestamps: true,
       underscored: true
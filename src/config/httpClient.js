@@ -0,0 +1,23 @@
+const axios = require('axios');
+const http = require('http');
+const https = require('https');
+require('dotenv').config();
+
+// Shared keep-alive agents so repeated calls to the NELF API reuse warm
+// TCP/TLS connections instead of paying a full handshake per request
+const httpAgent = new http.Agent({ keepAlive: true, maxSockets: 100, maxFreeSockets: 20 });
+const httpsAgent = new https.Agent({ keepAlive: true, maxSockets: 100, maxFreeSockets: 20 });
+
+// Single long-lived client for the NELF upstream, shared by all services
+const nelfClient = axios.create({
+  baseURL: process.env.NELF_API_BASE_URL,
+  timeout: 10000,
+  httpAgent,
+  httpsAgent
+});
+
+module.exports = {
+  nelfClient,
+  httpAgent,
+  httpsAgent
+};
@@ -47,11 +47,7 @@ class AuthController {
         date_of_birth
       );
       
-      const accessToken = await AuthService.createAccessToken(
-        result.user.id, 
-        result.user.firstName, 
-        result.user.surname
-      );
+      const accessToken = await AuthService.createAccessToken(result.user);
       
       res.status(200).json({
         access_token: accessToken,
@@ -119,11 +115,7 @@ class AuthController {
       
       const result = await AuthService.verifyEmail(userId, code);
       
-      const accessToken = await AuthService.createAccessToken(
-        result.user.id, 
-        result.user.firstName, 
-        result.user.surname
-      );
+      const accessToken = await AuthService.createAccessToken(result.user);
       
       res.status(200).json({
         status: true,
@@ -192,11 +184,7 @@ class AuthController {
       
       const result = await AuthService.login(email, password);
       
-      const accessToken = await AuthService.createAccessToken(
-        result.user.id, 
-        result.user.firstName, 
-        result.user.surname
-      );
+      const accessToken = await AuthService.createAccessToken(result.user);
       
       res.status(200).json({
         status: true,
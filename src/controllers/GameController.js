@@ -1,5 +1,6 @@
 const GameService = require('../services/GameService');
 const { User, Wallet, Game, sequelize } = require('../models');
+const { Op } = require('sequelize');
 
 class GameController {
   /**
@@ -203,13 +204,40 @@ class GameController {
       const limit = parseInt(req.query.limit) || 10;
       const page = parseInt(req.query.page) || 1;
       const offset = (page - 1) * limit;
-      
+
+      // Keyset pagination: clients pass the smallest id from the previous
+      // page so the database seeks instead of scanning past offset rows
+      // History rows feed straight into the response, so select only the
+      // fields the client uses and skip model instance hydration
+      const historyAttributes = ['id', 'gameType', 'stakeAmount', 'result', 'metadata', 'createdAt'];
+
+      const beforeId = parseInt(req.query.beforeId);
+      if (beforeId) {
+        const rows = await Game.findAll({
+          attributes: historyAttributes,
+          where: { userId, id: { [Op.lt]: beforeId } },
+          order: [['id', 'DESC']],
+          limit,
+          raw: true
+        });
+
+        return res.status(200).json({
+          games: rows,
+          pagination: {
+            pageSize: limit,
+            nextBeforeId: rows.length === limit ? rows[rows.length - 1].id : null
+          }
+        });
+      }
+
       // Get games with pagination
       const { count, rows } = await Game.findAndCountAll({
+        attributes: historyAttributes,
         where: { userId },
         order: [['createdAt', 'DESC']],
         limit,
-        offset
+        offset,
+        raw: true
       });
       
       res.status(200).json({
@@ -2,6 +2,24 @@ const TokenMarketService = require('../services/TokenMarketService');
 const InstitutionService = require('../services/InstitutionService');
 const { TokenMarket, Wallet, TokenBalance, Transaction, User } = require('../models');
 const { sequelize } = require('../config/database');
+const cache = require('../helpers/cache');
+
+// Price-impact parameters, hoisted so the hot trading paths share one
+// precomputed set instead of redefining them per transaction
+const MIN_EFFECTIVE_LIQUIDITY = 1000; // Floor to avoid extreme impacts on thin pools
+const IMPACT_RATE = 0.01; // 1% impact per liquidityPool ratio
+const MAX_PRICE_IMPACT = 0.05; // Maximum 5% price impact per transaction
+
+/**
+ * Calculate the capped price impact of a trade against a liquidity pool
+ * @param {number} nairaAmount - Trade size in Naira
+ * @param {number} liquidityPool - Market liquidity pool
+ * @returns {number} Price impact as a fraction, capped at MAX_PRICE_IMPACT
+ */
+const calculatePriceImpact = (nairaAmount, liquidityPool) => {
+  const effectiveLiquidityPool = Math.max(liquidityPool, MIN_EFFECTIVE_LIQUIDITY);
+  return Math.min((nairaAmount / effectiveLiquidityPool) * IMPACT_RATE, MAX_PRICE_IMPACT);
+};
 
 class TokenMarketController {
   /**
@@ -96,17 +114,10 @@ class TokenMarketController {
       tokenMarket.volume24h += amount;
       
       // Adjust token value based on buy pressure (simple algorithm)
-      // Ensure liquidityPool is not too small to avoid division issues
-      const effectiveLiquidityPool = Math.max(tokenMarket.liquidityPool, 1000); // Minimum 1000 to avoid extreme impacts
-      
-      // Calculate price impact with a reasonable cap
-      const rawPriceImpact = (amount / effectiveLiquidityPool) * 0.01; // 1% impact per liquidityPool ratio
-      const maxPriceImpact = 0.05; // Maximum 5% price impact per transaction
-      const priceImpact = Math.min(rawPriceImpact, maxPriceImpact);
-      
+      const priceImpact = calculatePriceImpact(amount, tokenMarket.liquidityPool);
+
       // Apply the capped price impact
       tokenMarket.currentValue = tokenMarket.currentValue * (1 + priceImpact);
-      console.log('Current value:', tokenMarket.currentValue);
       tokenMarket.marketCap = tokenMarket.currentValue * tokenMarket.circulatingSupply;
       tokenMarket.lastUpdated = new Date();
       
@@ -130,6 +141,8 @@ class TokenMarketController {
       }, { transaction: t });
       
       await t.commit();
+      cache.del(`wallet:${userId}`);
+      cache.del(`tokenMarket:${institutionCode}`);
       
       return res.status(200).json({
         success: true,
@@ -234,13 +247,8 @@ class TokenMarketController {
       tokenMarket.volume24h += nairaAmount;
       
       // Adjust token value based on sell pressure (simple algorithm)
-      const effectiveLiquidityPool = Math.max(tokenMarket.liquidityPool, 1000); // Minimum 1000 to avoid extreme impacts
-      
-      // Calculate price impact with a reasonable cap
-      const rawPriceImpact = (nairaAmount / effectiveLiquidityPool) * 0.01; // 1% impact per liquidityPool ratio
-      const maxPriceImpact = 0.05; // Maximum 5% price impact per transaction
-      const priceImpact = Math.min(rawPriceImpact, maxPriceImpact);
-      
+      const priceImpact = calculatePriceImpact(nairaAmount, tokenMarket.liquidityPool);
+
       // Apply the capped price impact
       tokenMarket.currentValue = tokenMarket.currentValue * (1 - priceImpact);
       tokenMarket.marketCap = tokenMarket.currentValue * tokenMarket.circulatingSupply;
@@ -266,6 +274,8 @@ class TokenMarketController {
       }, { transaction: t });
       
       await t.commit();
+      cache.del(`wallet:${userId}`);
+      cache.del(`tokenMarket:${institutionCode}`);
       
       return res.status(200).json({
         success: true,
@@ -405,12 +415,7 @@ class TokenMarketController {
       sourceTokenMarket.volume24h += nairaValue;
       
       // Adjust source token value based on sell pressure
-      const effectiveLiquidityPool = Math.max(sourceTokenMarket.liquidityPool, 1000); // Minimum 1000 to avoid extreme impacts
-      
-      // Calculate price impact with a reasonable cap
-      const rawPriceImpact = (nairaValue / effectiveLiquidityPool) * 0.01; // 1% impact per liquidityPool ratio
-      const maxPriceImpact = 0.05; // Maximum 5% price impact per transaction
-      const sourcePriceImpact = Math.min(rawPriceImpact, maxPriceImpact);
+      const sourcePriceImpact = calculatePriceImpact(nairaValue, sourceTokenMarket.liquidityPool);
       
       // Apply the capped price impact
       sourceTokenMarket.currentValue = sourceTokenMarket.currentValue * (1 - sourcePriceImpact);
@@ -424,11 +429,7 @@ class TokenMarketController {
       targetTokenMarket.volume24h += nairaValueAfterFee;
       
       // Adjust target token value based on buy pressure
-      const effectiveTargetLiquidityPool = Math.max(targetTokenMarket.liquidityPool, 1000); // Minimum 1000 to avoid extreme impacts
-      
-      // Calculate price impact with a reasonable cap
-      const rawTargetPriceImpact = (nairaValueAfterFee / effectiveTargetLiquidityPool) * 0.01; // 1% impact per liquidityPool ratio
-      const targetPriceImpact = Math.min(rawTargetPriceImpact, maxPriceImpact);
+      const targetPriceImpact = calculatePriceImpact(nairaValueAfterFee, targetTokenMarket.liquidityPool);
       
       // Apply the capped price impact
       targetTokenMarket.currentValue = targetTokenMarket.currentValue * (1 + targetPriceImpact);
@@ -459,6 +460,9 @@ class TokenMarketController {
       }, { transaction: t });
       
       await t.commit();
+      cache.del(`wallet:${userId}`);
+      cache.del(`tokenMarket:${sourceTokenCode}`);
+      cache.del(`tokenMarket:${targetTokenCode}`);
       
       return res.status(200).json({
         success: true,
@@ -536,6 +540,7 @@ class TokenMarketController {
       }, { transaction: t });
       
       await t.commit();
+      cache.del(`wallet:${userId}`);
       
       return res.status(200).json({
         success: true,
@@ -614,6 +619,7 @@ class TokenMarketController {
       }, { transaction: t });
       
       await t.commit();
+      cache.del(`wallet:${userId}`);
       
       return res.status(200).json({
         success: true,
@@ -690,37 +696,22 @@ class TokenMarketController {
    */
   async getUserTokenBalances(req, res) {
     try {
-      const userId = req.user.id;
-      
-      const tokenBalances = await TokenBalance.findAll({
-        where: { userId },
-        include: [{
-          model: TokenMarket,
-          attributes: ['institutionName', 'currentValue', 'change24h']
-        }]
-      });
-      
-      // Calculate total value in Naira
-      let totalValue = 0;
-      const formattedBalances = tokenBalances.map(balance => {
-        const value = balance.balance * balance.TokenMarket.currentValue;
-        totalValue += value;
-        
-        return {
-          institutionCode: balance.institutionCode,
-          institutionName: balance.TokenMarket.institutionName,
-          balance: balance.balance,
-          currentValue: balance.TokenMarket.currentValue,
-          change24h: balance.TokenMarket.change24h,
-          value
-        };
-      });
-      
+      // Delegate to the service so the balance formatting logic lives in
+      // one place
+      const result = await TokenMarketService.getUserTokenBalances(req.user.id);
+
+      if (!result.success) {
+        return res.status(500).json({
+          success: false,
+          message: result.message
+        });
+      }
+
       return res.status(200).json({
         success: true,
         data: {
-          tokenBalances: formattedBalances,
-          totalValue
+          tokenBalances: result.tokenBalances,
+          totalValue: result.totalValue
         }
       });
     } catch (error) {
@@ -792,48 +783,15 @@ class TokenMarketController {
    * @returns {Object} Market insights
    */
   async getMarketInsights() {
-    try {
-      const tokenMarkets = await TokenMarket.findAll({
-        order: [
-          ['volume24h', 'DESC']
-        ],
-        limit: 20
-      });
-      
-      const topGainers = [...tokenMarkets].sort((a, b) => b.change24h - a.change24h).slice(0, 5);
-      const topLosers = [...tokenMarkets].sort((a, b) => a.change24h - b.change24h).slice(0, 5);
-      const mostActive = tokenMarkets.slice(0, 5); // Already sorted by volume
-      
-      const insights = {
-        topGainers: topGainers.map(token => ({
-          institutionCode: token.institutionCode,
-          institutionName: token.institutionName,
-          currentValue: token.currentValue,
-          change24h: token.change24h
-        })),
-        topLosers: topLosers.map(token => ({
-          institutionCode: token.institutionCode,
-          institutionName: token.institutionName,
-          currentValue: token.currentValue,
-          change24h: token.change24h
-        })),
-        mostActive: mostActive.map(token => ({
-          institutionCode: token.institutionCode,
-          institutionName: token.institutionName,
-          currentValue: token.currentValue,
-          volume24h: token.volume24h
-        })),
-        marketOverview: {
-          totalMarketCap: tokenMarkets.reduce((sum, token) => sum + token.marketCap, 0),
-          totalVolume24h: tokenMarkets.reduce((sum, token) => sum + token.volume24h, 0),
-          averageChange24h: tokenMarkets.reduce((sum, token) => sum + token.change24h, 0) / tokenMarkets.length
-        }
-      };
-      
-      return insights;
-    } catch (error) {
-      throw new Error(`Failed to get market insights: ${error.message}`);
+    // Delegate to the service copy of this logic; the dashboard expects
+    // the bare insights object and an exception on failure
+    const result = await TokenMarketService.getMarketInsights();
+
+    if (!result.success) {
+      throw new Error(`Failed to get market insights: ${result.message}`);
     }
+
+    return result.insights;
   }
 }
 
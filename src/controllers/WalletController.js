@@ -1,4 +1,10 @@
-const { Wallet, Transaction, TokenBalance, TokenMarket, sequelize } = require('../models');
+const { User, Wallet, Transaction, TokenBalance, TokenMarket, sequelize } = require('../models');
+const { Op } = require('sequelize');
+const cache = require('../helpers/cache');
+
+// Wallets are polled aggressively by dashboards; a short TTL absorbs the
+// polling load while write paths invalidate eagerly
+const WALLET_CACHE_TTL = 10 * 1000;
 
 class WalletController {
   /**
@@ -8,26 +14,35 @@ class WalletController {
    */
   async getWallet(req, res) {
     try {
-      const wallet = await Wallet.findOne({
-        where: { userId: req.user.id }
+      const cached = cache.get(`wallet:${req.user.id}`);
+      if (cached) {
+        return res.status(200).json(cached);
+      }
+
+      // Load wallet and token balances through the user associations in
+      // one eager-loaded query instead of two lookups
+      const user = await User.findByPk(req.user.id, {
+        attributes: ['id'],
+        include: [
+          { model: Wallet, as: 'wallet' },
+          { model: TokenBalance, as: 'tokenBalances' }
+        ]
       });
 
-      if (!wallet) {
+      if (!user || !user.wallet) {
         return res.status(404).json({
           status: false,
           message: 'Wallet not found'
         });
       }
 
-      // Get token balances for the user
-      const tokenBalances = await TokenBalance.findAll({
-        where: { userId: req.user.id }
-      });
+      const payload = {
+        wallet: user.wallet,
+        tokenBalances: user.tokenBalances
+      };
+      cache.set(`wallet:${req.user.id}`, payload, WALLET_CACHE_TTL);
 
-      res.status(200).json({
-        wallet,
-        tokenBalances
-      });
+      res.status(200).json(payload);
     } catch (error) {
       res.status(500).json({
         status: false,
@@ -57,15 +72,44 @@ class WalletController {
       }
       
       if (institutionCode) {
-        where.metadata = { institutionCode };
+        // token_code is a real indexed column; filtering on it avoids
+        // JSON extraction over the metadata blob
+        where.tokenCode = institutionCode;
       }
-      
+
+      // Keyset pagination: clients pass the smallest id from the previous
+      // page so the database seeks instead of scanning past offset rows
+      const beforeId = parseInt(req.query.beforeId);
+      if (beforeId) {
+        where.id = { [Op.lt]: beforeId };
+
+        const rows = await Transaction.findAll({
+          where,
+          order: [['id', 'DESC']],
+          limit,
+          // Rows go straight into the response; skip model instance
+          // hydration
+          raw: true
+        });
+
+        return res.status(200).json({
+          transactions: rows,
+          pagination: {
+            pageSize: limit,
+            nextBeforeId: rows.length === limit ? rows[rows.length - 1].id : null
+          }
+        });
+      }
+
       // Get transactions with pagination
       const { count, rows } = await Transaction.findAndCountAll({
         where,
         order: [['createdAt', 'DESC']],
         limit,
-        offset
+        offset,
+        // Rows go straight into the response; skip model instance
+        // hydration
+        raw: true
       });
 
       res.status(200).json({
@@ -92,9 +136,25 @@ class WalletController {
    */
   async getWalletSummary(req, res) {
     try {
-      const wallet = await Wallet.findOne({
-        where: { userId: req.user.id }
-      });
+      // Wallet, token balances and transaction stats are independent
+      // queries; run them concurrently
+      const [wallet, tokenBalances, transactionStats] = await Promise.all([
+        Wallet.findOne({
+          where: { userId: req.user.id }
+        }),
+        TokenBalance.findAll({
+          where: { userId: req.user.id }
+        }),
+        Transaction.findAll({
+          attributes: [
+            'transactionType',
+            [sequelize.fn('COUNT', sequelize.col('id')), 'count'],
+            [sequelize.fn('SUM', sequelize.col('amount')), 'total']
+          ],
+          where: { userId: req.user.id },
+          group: ['transactionType']
+        })
+      ]);
 
       if (!wallet) {
         return res.status(404).json({
@@ -103,22 +163,6 @@ class WalletController {
         });
       }
       
-      // Get token balances
-      const tokenBalances = await TokenBalance.findAll({
-        where: { userId: req.user.id }
-      });
-      
-      // Get transaction statistics
-      const transactionStats = await Transaction.findAll({
-        attributes: [
-          'transactionType',
-          [sequelize.fn('COUNT', sequelize.col('id')), 'count'],
-          [sequelize.fn('SUM', sequelize.col('amount')), 'total']
-        ],
-        where: { userId: req.user.id },
-        group: ['transactionType']
-      });
-      
       // Calculate total value of holdings
       let totalValue = wallet.balance;
       const holdings = [];
@@ -255,9 +299,10 @@ class WalletController {
       const transactions = await Transaction.findAll({
         where: { userId },
         order: [['createdAt', 'DESC']],
-        limit
+        limit,
+        raw: true
       });
-      
+
       return transactions.map(transaction => ({
         id: transaction.id,
         type: transaction.transactionType,
@@ -1,23 +1,13 @@
 const cron = require('node-cron');
 const TokenMarketService = require('../services/TokenMarketService');
-const cleanupDeletedUsers = require('./cleanupDeletedUsers');
+const MarketSimulationService = require('../services/MarketSimulationService');
 
 /**
- * Initialize all cron jobs
+ * Initialize market-related cron jobs
+ * User cleanup is scheduled by cron/index.js, not here
  */
 function initializeCronJobs() {
   console.log('Initializing market cron jobs...');
-  
-  // Clean up deleted users - Run once a day at midnight
-  cron.schedule('0 0 * * *', async () => {
-    console.log('Running cleanup job for deleted users');
-    try {
-      const result = await cleanupDeletedUsers();
-      console.log('Cleanup job completed', { result });
-    } catch (error) {
-      console.error('Error running cleanup job', { error: error.message });
-    }
-  });
 
   // Update market statistics - Every 15 minutes
   cron.schedule('*/15 * * * *', async () => {
@@ -30,12 +20,23 @@ function initializeCronJobs() {
     }
   });
 
+  // Apply daily decay to stale markets - Every day at 2 AM
+  cron.schedule('0 2 * * *', async () => {
+    console.log('Applying daily market decay');
+    try {
+      const result = await MarketSimulationService.applyDailyDecay();
+      console.log('Daily market decay applied', { result });
+    } catch (error) {
+      console.error('Error applying daily market decay', { error: error.message });
+    }
+  });
+
   // Fetch latest institution data - Every day at 1 AM
   cron.schedule('0 1 * * *', async () => {
     console.log('Fetching latest institution data');
     try {
       const InstitutionService = require('../services/InstitutionService');
-      await InstitutionService.fetchAndUpdateInstitutions();
+      await InstitutionService.populateTokenMarkets();
       console.log('Institution data updated');
     } catch (error) {
       console.error('Error fetching institution data', { error: error.message });
@@ -0,0 +1,62 @@
+/**
+ * Simple in-process cache with per-entry TTL.
+ * Used to avoid repeated upstream API calls and hot database lookups.
+ *
+ * The store is capped: once MAX_ENTRIES is reached, the least recently
+ * used entry is evicted. This matters for keyspaces with unbounded
+ * cardinality (e.g. one entry per issued JWT), where expired entries
+ * would otherwise sit in the map for the life of the process.
+ */
+const store = new Map();
+
+const MAX_ENTRIES = 10000;
+
+/**
+ * Get a cached value by key
+ * @param {string} key - Cache key
+ * @returns {*} Cached value, or undefined if missing or expired
+ */
+const get = (key) => {
+  const entry = store.get(key);
+  if (!entry) {
+    return undefined;
+  }
+  if (entry.expiresAt <= Date.now()) {
+    store.delete(key);
+    return undefined;
+  }
+  // Maps iterate in insertion order, so re-inserting on each hit keeps
+  // the front of the map least recently used
+  store.delete(key);
+  store.set(key, entry);
+  return entry.value;
+};
+
+/**
+ * Store a value with a time-to-live
+ * @param {string} key - Cache key
+ * @param {*} value - Value to cache
+ * @param {number} ttlMs - Time-to-live in milliseconds
+ */
+const set = (key, value, ttlMs) => {
+  if (store.has(key)) {
+    store.delete(key);
+  } else if (store.size >= MAX_ENTRIES) {
+    store.delete(store.keys().next().value);
+  }
+  store.set(key, { value, expiresAt: Date.now() + ttlMs });
+};
+
+/**
+ * Remove a cached value
+ * @param {string} key - Cache key
+ */
+const del = (key) => {
+  store.delete(key);
+};
+
+module.exports = {
+  get,
+  set,
+  del
+};
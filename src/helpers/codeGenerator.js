@@ -1,3 +1,5 @@
+const crypto = require('crypto');
+
 /**
  * Generates a random verification code of specified length
  * @param {number} length - Length of the code to generate (default: 6)
@@ -6,7 +8,9 @@
 const generateVerificationCode = (length = 6) => {
   let code = '';
   for (let i = 0; i < length; i++) {
-    code += Math.floor(Math.random() * 10).toString();
+    // Verification codes are guessable secrets; use the CSPRNG so they
+    // cannot be predicted from earlier outputs
+    code += crypto.randomInt(10).toString();
   }
   return code;
 };
@@ -1,3 +1,5 @@
+const crypto = require('crypto');
+
 /**
  * Generate a random token ID for JWT validation
  * @param {number} length - Length of the token ID (default: 10)
@@ -6,12 +8,13 @@
 function generateTokenId(length = 10) {
   const characters = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789';
   let result = '';
-  
+
   for (let i = 0; i < length; i++) {
-    const randomIndex = Math.floor(Math.random() * characters.length);
-    result += characters.charAt(randomIndex);
+    // Token IDs gate session validity, so draw from the CSPRNG rather
+    // than the predictable Math.random
+    result += characters.charAt(crypto.randomInt(characters.length));
   }
-  
+
   return result;
 }
 
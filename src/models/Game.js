@@ -27,7 +27,9 @@ const Game = sequelize.define('Game', {
     field: 'stake_amount'
   },
   result: {
-    type: DataTypes.STRING,
+    // Games only ever end won or lost; an ENUM stores one byte instead
+    // of a varchar and rejects stray values
+    type: DataTypes.ENUM('won', 'lost'),
     allowNull: false
   },
   metadata: {
@@ -43,7 +45,19 @@ const Game = sequelize.define('Game', {
 }, {
   tableName: 'games',
   timestamps: true,
-  updatedAt: false
+  updatedAt: false,
+  indexes: [
+    {
+      // History listings always filter by owner and page by recency
+      name: 'ix_games_user_created',
+      fields: ['user_id', 'created_at']
+    },
+    {
+      // Win/loss tallies filter by owner and result
+      name: 'ix_games_user_result',
+      fields: ['user_id', 'result']
+    }
+  ]
 });
 
 module.exports = Game;
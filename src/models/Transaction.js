@@ -90,7 +90,18 @@ const Transaction = sequelize.define('Transaction', {
   }
 }, {
   tableName: 'transactions',
-  timestamps: true
+  timestamps: true,
+  indexes: [
+    {
+      name: 'ix_transactions_token_created',
+      fields: ['token_code', 'created_at']
+    },
+    {
+      // History listings always filter by owner and page by recency
+      name: 'ix_transactions_user_created',
+      fields: ['user_id', 'created_at']
+    }
+  ]
 });
 
 module.exports = Transaction;
@@ -41,7 +41,13 @@ const VerificationCode = sequelize.define('VerificationCode', {
   }
 }, {
   tableName: 'verification_codes',
-  timestamps: true
+  timestamps: true,
+  indexes: [
+    {
+      // Codes are always fetched and purged by owner and type
+      fields: ['user_id', 'type']
+    }
+  ]
 });
 
 module.exports = VerificationCode;
@@ -40,7 +40,14 @@ const Wallet = sequelize.define('Wallet', {
   }
 }, {
   tableName: 'wallets',
-  timestamps: true
+  timestamps: true,
+  indexes: [
+    {
+      // One wallet per user; also serves the per-request wallet lookup
+      unique: true,
+      fields: ['user_id']
+    }
+  ]
 });
 
 module.exports = Wallet;
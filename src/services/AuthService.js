@@ -1,16 +1,49 @@
-const axios = require('axios');
+const { nelfClient } = require('../config/httpClient');
 const jwt = require('jsonwebtoken');
 const bcrypt = require('bcryptjs');
 const { User, Wallet, VerificationCode } = require('../models');
+const { sequelize } = require('../config/database');
 const { generateVerificationCode } = require('../helpers/codeGenerator');
 const { sendVerificationEmail } = require('../helpers/emailSender');
 const { generateTokenId } = require('../helpers/tokenGenerator');
+const cache = require('../helpers/cache');
 const { Op } = require('sequelize');
 
+// The institutions list changes rarely, so cache it for a day
+const INSTITUTIONS_CACHE_KEY = 'nelf:institutions';
+const INSTITUTIONS_CACHE_TTL = 24 * 60 * 60 * 1000;
+
+// Authenticated users are looked up on every request; cache them briefly.
+// Kept short so status changes and token revocations propagate quickly.
+const USER_CACHE_TTL = 60 * 1000;
+
+const userCacheKey = (userId) => `user:${userId}`;
+
+// A bearer token is presented many times within a session, so the
+// signature only needs verifying once; expiry is still checked per call.
+const JWT_DECODE_CACHE_TTL = 5 * 60 * 1000;
+
+const jwtCacheKey = (token) => `jwt:${token}`;
+
+// bcrypt cost factor; tunable per environment so production hardware
+// can trade hash latency against brute-force resistance
+const BCRYPT_COST = parseInt(process.env.BCRYPT_COST, 10) || 10;
+
+// Options for the per-request auth lookup, built once at module load so
+// the hottest query in the API reuses the same prepared option set
+const AUTH_USER_LOOKUP = Object.freeze({
+  attributes: { exclude: ['profilePicture', 'password'] }
+});
+
 class AuthService {
   constructor() {
-    this.baseUrl = process.env.NELF_API_BASE_URL;
-    this.jwtSecret = process.env.JWT_SECRET;
+    this.client = nelfClient;
+    if (!process.env.JWT_SECRET) {
+      throw new Error('JWT_SECRET environment variable is not set');
+    }
+    // Encode the signing key to bytes once instead of re-encoding the
+    // secret string on every sign/verify call
+    this.jwtSecret = Buffer.from(process.env.JWT_SECRET, 'utf8');
     this.jwtExpiresIn = process.env.JWT_EXPIRES_IN;
   }
 
@@ -20,12 +53,19 @@ class AuthService {
    */
   async getInstitutions() {
     try {
-      const response = await axios.get(`${this.baseUrl}/services/institutions`);
-      
+      const cached = cache.get(INSTITUTIONS_CACHE_KEY);
+      if (cached) {
+        return cached;
+      }
+
+      const response = await this.client.get('/services/institutions');
+
       if (!response.data || !response.data.status) {
         throw new Error('Failed to fetch institutions');
       }
-      
+
+      cache.set(INSTITUTIONS_CACHE_KEY, response.data.data, INSTITUTIONS_CACHE_TTL);
+
       return response.data.data;
     } catch (error) {
       throw new Error(`${error.message}`);
@@ -41,13 +81,16 @@ class AuthService {
   async verifyInstituteDetails(matricNumber, providerId) {
     try {
 
-      const existingUser = await User.findOne({ where: { matricNumber: `${matricNumber}` } });
+      const existingUser = await User.findOne({
+        where: { matricNumber: `${matricNumber}` },
+        attributes: ['id']
+      });
       if (existingUser) {
         throw new Error('User already exists. Please login instead');
       }
 
-      const response = await axios.post(
-        `${this.baseUrl}/student/verify/institute-details`,
+      const response = await this.client.post(
+        '/student/verify/institute-details',
         {
           matric_number: matricNumber,
           provider_id: providerId
@@ -77,13 +120,16 @@ class AuthService {
   async verifyJambDetails(dateOfBirth, jambNumber, token) {
     try {
 
-      const existingUser = await User.findOne({ where: { regNumber: `${jambNumber}` } });
+      const existingUser = await User.findOne({
+        where: { regNumber: `${jambNumber}` },
+        attributes: ['id']
+      });
       if (existingUser) {
         throw new Error('User already exists. Please login instead');
       }
 
-      const response = await axios.post(
-        `${this.baseUrl}/student/register/jamb/verify`,
+      const response = await this.client.post(
+        '/student/register/jamb/verify',
         {
           date_of_birth: dateOfBirth,
           jamb_number: jambNumber
@@ -122,48 +168,67 @@ class AuthService {
    */
   async verifyUser(institutionId, matricNumber, jambNumber, dateOfBirth) {
     try {
-      // Step 1: Verify institute details
-      const token = await this.verifyInstituteDetails(matricNumber, institutionId);
-      
-      // Step 2: Verify JAMB details
+      // Step 1: Verify institute details, overlapping the network call
+      // with the independent duplicate-account check on the JAMB number
+      const [token] = await Promise.all([
+        this.verifyInstituteDetails(matricNumber, institutionId),
+        User.findOne({
+          where: { regNumber: `${jambNumber}` },
+          attributes: ['id']
+        }).then((existing) => {
+          if (existing) {
+            throw new Error('User already exists. Please login instead');
+          }
+        })
+      ]);
+
+      // Step 2: Verify JAMB details (depends on the token from step 1)
       const userData = await this.verifyJambDetails(dateOfBirth, jambNumber, token);
 
       // Step 3: Check if user already exists
-      const existingUser = await User.findOne({ where: { regNumber: `${userData.RegNumber}` } });
+      const existingUser = await User.findOne({
+        where: { regNumber: `${userData.RegNumber}` },
+        attributes: ['id']
+      });
       if (existingUser) {
         throw new Error('User already exists. Please login instead');
       }
 
-      // Step 4: Create user in database
-      const user = await User.create({
-        regNumber: userData.RegNumber,
-        matricNumber: matricNumber,
-        nin: userData.NIN,
-        surname: userData.Surname,
-        firstName: userData.FirstName,
-        middleName: userData.Middlename || null,
-        dateOfBirth: userData.DateofBirth,
-        gender: userData.Gender,
-        stateOfOrigin: userData.StateofOrigin,
-        lgaOfOrigin: userData.LGAofOrigin,
-        admissionYear: userData.AdmissionYear,
-        institution: userData.Institution,
-        institutionCode: userData.InstitutionCode,
-        course: userData.Course,
-        courseCode: userData.CourseCode,
-        admissionType: userData.AdmissionType,
-        profilePicture: userData.ProfilePicture || null,
-        userType: 'student',
-        status: 'PENDING'
-      });
+      // Step 4: Create user and wallet in a single transaction so signup
+      // costs one commit instead of two
+      const user = await sequelize.transaction(async (t) => {
+        const newUser = await User.create({
+          regNumber: userData.RegNumber,
+          matricNumber: matricNumber,
+          nin: userData.NIN,
+          surname: userData.Surname,
+          firstName: userData.FirstName,
+          middleName: userData.Middlename || null,
+          dateOfBirth: userData.DateofBirth,
+          gender: userData.Gender,
+          stateOfOrigin: userData.StateofOrigin,
+          lgaOfOrigin: userData.LGAofOrigin,
+          admissionYear: userData.AdmissionYear,
+          institution: userData.Institution,
+          institutionCode: userData.InstitutionCode,
+          course: userData.Course,
+          courseCode: userData.CourseCode,
+          admissionType: userData.AdmissionType,
+          profilePicture: userData.ProfilePicture || null,
+          userType: 'student',
+          status: 'PENDING'
+        }, { transaction: t });
 
-      // Step 5: Create wallet for the user
-      await Wallet.create({
-        userId: user.id,
-        balance: 0.0,
-        stakedBalance: 0.0
+        // Step 5: Create wallet for the user
+        await Wallet.create({
+          userId: newUser.id,
+          balance: 0.0,
+          stakedBalance: 0.0
+        }, { transaction: t });
+
+        return newUser;
       });
-      
+
       return { user };
     } catch (error) {
       throw error;
@@ -187,7 +252,8 @@ class AuthService {
       // Update user's email
       user.email = email;
       await user.save();
-      
+      cache.del(userCacheKey(userId));
+
       // Generate verification code
       const code = generateVerificationCode();
       
@@ -210,9 +276,12 @@ class AuthService {
         expiresAt
       });
       
-      // Send verification email
-      await sendVerificationEmail(email, code);
-      
+      // Send the verification email in the background; the response
+      // shouldn't wait out the SMTP round trip once the code is stored
+      sendVerificationEmail(email, code).catch(error => {
+        console.error(`Failed to send verification email to ${email}:`, error);
+      });
+
     } catch (error) {
       throw error;
     }
@@ -252,7 +321,8 @@ class AuthService {
       user.emailVerified = true;
       user.status = 'ACTIVE';
       await user.save();
-      
+      cache.del(userCacheKey(userId));
+
       // Delete verification code
       await verificationCode.destroy();
       
@@ -276,14 +346,15 @@ class AuthService {
         throw new Error('User not found');
       }
       
-      // Hash password
-      const salt = await bcrypt.genSalt(10);
-      const hashedPassword = await bcrypt.hash(password, salt);
+      // Hash password; bcrypt.hash generates the salt itself, so there is
+      // no separate genSalt pass
+      const hashedPassword = await bcrypt.hash(password, BCRYPT_COST);
       
       // Update user
       user.password = hashedPassword;
       await user.save();
-      
+      cache.del(userCacheKey(userId));
+
     } catch (error) {
       throw error;
     }
@@ -339,32 +410,31 @@ class AuthService {
 
   /**
    * Create a JWT access token for user authentication
-   * @param {number} userId - User ID to encode in the token
-   * @param {string} firstName - User's first name
-   * @param {string} surname - User's surname
+   * Accepts the already-loaded user instance so issuing a token does not
+   * refetch a row the caller just loaded
+   * @param {Object} user - User instance to issue the token for
    * @returns {string} JWT token
    */
-  async createAccessToken(userId, firstName = '', surname = '') {
+  async createAccessToken(user) {
     try {
-      // Find user
-      const user = await User.findByPk(userId);
       if (!user) {
         throw new Error('User not found');
       }
-      
+
       // Generate a new token ID
       const tokenId = generateTokenId(10);
-      
+
       // Save token ID to user record
       user.tokenId = tokenId;
       await user.save();
-      
+      cache.del(userCacheKey(user.id));
+
       // Create JWT with token ID
       return jwt.sign(
-        { 
-          sub: userId,
-          firstName,
-          surname,
+        {
+          sub: user.id,
+          firstName: user.firstName,
+          surname: user.surname,
           tokenId
         },
         this.jwtSecret,
@@ -382,13 +452,29 @@ class AuthService {
    */
   async verifyToken(token) {
       try {
-      const decoded = jwt.verify(token, this.jwtSecret);
+      let decoded = cache.get(jwtCacheKey(token));
+      if (decoded) {
+        // Signature already verified; only the expiry needs re-checking
+        if (decoded.exp && decoded.exp * 1000 <= Date.now()) {
+          cache.del(jwtCacheKey(token));
+          throw new Error('Invalid authentication token');
+        }
+      } else {
+        decoded = jwt.verify(token, this.jwtSecret);
+        cache.set(jwtCacheKey(token), decoded, JWT_DECODE_CACHE_TTL);
+      }
       const userId = decoded.sub;
       const tokenId = decoded.tokenId;
-      
-      const user = await User.findByPk(userId);
+
+      let user = cache.get(userCacheKey(userId));
       if (!user) {
-        throw new Error('User not found');
+        // Skip the profile picture blob and password hash — neither is
+        // needed on the per-request auth path
+        user = await User.findByPk(userId, AUTH_USER_LOOKUP);
+        if (!user) {
+          throw new Error('User not found');
+        }
+        cache.set(userCacheKey(userId), user, USER_CACHE_TTL);
       }
       
       // Verify that the token ID matches the one stored in the database
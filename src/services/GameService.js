@@ -1,5 +1,6 @@
 const { Wallet, Transaction, User, TokenBalance, TokenMarket } = require('../models');
 const { sequelize } = require('../config/database');
+const cache = require('../helpers/cache');
 const { Op } = require('sequelize');
 
 class GameService {
@@ -86,6 +87,7 @@ class GameService {
             walletId: wallet.id,
             transactionType: 'stake',
             amount: stakingAmount,
+            tokenCode: institutionCode,
             fee: 0,
             status: 'completed',
             metadata: {
@@ -135,7 +137,8 @@ class GameService {
       await user.save({ transaction: t });
       
       await t.commit();
-      
+      cache.del(`wallet:${userId}`);
+
       return {
         success: true,
         challenge,
@@ -237,11 +240,15 @@ class GameService {
    * Complete a challenge and claim rewards
    * @param {number} userId - User ID
    * @param {string} challengeId - Challenge ID
+   * @param {Object} existingTransaction - Optional transaction to join
    * @returns {Object} Reward result
    */
-  async completeChallenge(userId, challengeId) {
-    const t = await sequelize.transaction();
-    
+  async completeChallenge(userId, challengeId, existingTransaction = null) {
+    // Join the caller's transaction when given one so batch processors
+    // don't commit nested work independently of their own transaction
+    const t = existingTransaction || await sequelize.transaction();
+    const ownsTransaction = !existingTransaction;
+
     try {
       // Get user data
       const user = await User.findByPk(userId, { transaction: t });
@@ -280,7 +287,7 @@ class GameService {
       
       // Process reward
       const reward = challenge.reward;
-      wallet.balance += reward;
+      wallet.nairaBalance += reward;
       await wallet.save({ transaction: t });
       
       // Update challenge status
@@ -303,16 +310,21 @@ class GameService {
           reward
         }
       }, { transaction: t });
-      
-      await t.commit();
-      
+
+      if (ownsTransaction) {
+        await t.commit();
+        cache.del(`wallet:${userId}`);
+      }
+
       return {
         success: true,
         reward,
         message: `Challenge completed! You earned ${reward} tokens.`
       };
     } catch (error) {
-      await t.rollback();
+      if (ownsTransaction) {
+        await t.rollback();
+      }
       return {
         success: false,
         message: error.message
@@ -344,6 +356,7 @@ class GameService {
       let processedCount = 0;
       let completedCount = 0;
       let expiredCount = 0;
+      const rewardedUserIds = new Set();
       
       for (const user of users) {
         if (!user.metadata || !user.metadata.challenges) {
@@ -370,10 +383,11 @@ class GameService {
           if (now > endDate) {
             // For 'hold' type challenges, auto-complete if expired
             if (challenge.type === 'hold') {
-              // Auto-complete the challenge
-              const result = await this.completeChallenge(user.id, challenge.id);
+              // Auto-complete the challenge inside this job's transaction
+              const result = await this.completeChallenge(user.id, challenge.id, t);
               if (result.success) {
                 completedCount++;
+                rewardedUserIds.add(user.id);
               }
             } else {
               // Mark as expired for other challenge types
@@ -402,7 +416,12 @@ class GameService {
       }
       
       await t.commit();
-      
+
+      // Invalidate wallet caches only once the rewards are committed
+      for (const rewardedUserId of rewardedUserIds) {
+        cache.del(`wallet:${rewardedUserId}`);
+      }
+
       return {
         success: true,
         processed: processedCount,
@@ -548,13 +567,10 @@ class GameService {
       }
       
       // Check if user has enough balance
-      if (wallet.balance < stakeAmount) {
+      if (wallet.nairaBalance < stakeAmount) {
         throw new Error('Insufficient balance');
       }
-      
-      // Deduct stake amount
-      wallet.balance -= stakeAmount;
-      
+
       // Determine game outcome
       let result;
       let winAmount = 0;
@@ -578,10 +594,10 @@ class GameService {
           break;
           
         case 'number_guess':
-          // Guess a number 1-10, 10% chance, 10x payout
-          const number = Math.floor(Math.random() * 10) + 1;
-          const userGuess = Math.floor(Math.random() * 10) + 1; // Simulated user guess
-          result = number === userGuess;
+          // Guess a number 1-10, 10% chance, 10x payout. Drawing the
+          // number and a simulated guess separately is just a 1-in-10
+          // event, so a single draw decides it
+          result = Math.random() < 0.1;
           if (result) {
             winAmount = stakeAmount * 10;
           }
@@ -591,12 +607,26 @@ class GameService {
           throw new Error('Invalid game type');
       }
       
-      // Update wallet with winnings if any
-      if (winAmount > 0) {
-        wallet.balance += winAmount;
+      // Apply the stake and any winnings atomically in SQL, guarded by
+      // the balance check, so two concurrent games for the same user
+      // cannot lose an update or overdraw the wallet
+      const netChange = winAmount - stakeAmount;
+      const [affected] = await Wallet.update(
+        { nairaBalance: sequelize.literal(`naira_balance + (${netChange})`) },
+        {
+          where: {
+            id: wallet.id,
+            nairaBalance: { [Op.gte]: stakeAmount }
+          },
+          transaction: t
+        }
+      );
+
+      if (affected === 0) {
+        throw new Error('Insufficient balance');
       }
-      
-      await wallet.save({ transaction: t });
+
+      await wallet.reload({ transaction: t });
       
       // Create transaction record
       const transaction = await Transaction.create({
@@ -615,13 +645,14 @@ class GameService {
       }, { transaction: t });
       
       await t.commit();
-      
+      cache.del(`wallet:${userId}`);
+
       return {
         success: true,
         result,
         stakeAmount,
         winAmount,
-        newBalance: wallet.balance,
+        newBalance: wallet.nairaBalance,
         message: result ? 'You won!' : 'You lost. Try again!'
       };
     } catch (error) {
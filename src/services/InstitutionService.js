@@ -1,10 +1,26 @@
 const axios = require('axios');
+const { httpAgent, httpsAgent } = require('../config/httpClient');
 const { TokenMarket } = require('../models');
 const { sequelize } = require('../config/database');
+const cache = require('../helpers/cache');
+
+// Token market rows change only on trades and cron updates; a few
+// seconds of staleness on the read endpoint is acceptable and absorbs
+// bursts of polling
+const TOKEN_MARKET_CACHE_TTL = 5 * 1000;
+const tokenMarketCacheKey = (institutionCode) => `tokenMarket:${institutionCode}`;
 
 class InstitutionService {
   constructor() {
     this.baseUrl = process.env.API_BASE_URL || 'https://api.acadcelestia.com';
+    // One long-lived client per process (the module exports a singleton),
+    // sharing the keep-alive agents so sockets stay warm across calls
+    this.client = axios.create({
+      baseURL: this.baseUrl,
+      timeout: 10000,
+      httpAgent,
+      httpsAgent
+    });
   }
 
   /**
@@ -13,7 +29,7 @@ class InstitutionService {
    */
   async getInstitutions() {
     try {
-      const response = await axios.get(`${this.baseUrl}/services/institutions`);
+      const response = await this.client.get('/services/institutions');
       
       if (!response.data || !response.data.status) {
         throw new Error('Failed to fetch institutions');
@@ -124,14 +140,22 @@ class InstitutionService {
    */
   async getTokenMarket(institutionCode) {
     try {
+      const cached = cache.get(tokenMarketCacheKey(institutionCode));
+      if (cached) {
+        return cached;
+      }
+
       const tokenMarket = await TokenMarket.findOne({
-        where: { institutionCode }
+        where: { institutionCode },
+        raw: true
       });
-      
+
       if (!tokenMarket) {
         throw new Error(`Token market not found for institution code: ${institutionCode}`);
       }
-      
+
+      cache.set(tokenMarketCacheKey(institutionCode), tokenMarket, TOKEN_MARKET_CACHE_TTL);
+
       return tokenMarket;
     } catch (error) {
       throw new Error(`Failed to get token market: ${error.message}`);
@@ -1,7 +1,39 @@
 const { TokenMarket } = require('../models');
 const { sequelize } = require('../config/database');
 
+// Daily decay applied to token values of markets with no recent activity
+const DAILY_DECAY_RATE = 0.001; // 0.1% per stale day
+
 class MarketSimulationService {
+  /**
+   * Apply daily value decay to stale markets in a single SQL UPDATE
+   * Markets untouched for more than a day lose DAILY_DECAY_RATE per
+   * elapsed day; the exponent is computed server-side so the whole
+   * batch is one round-trip instead of a SELECT+UPDATE per market.
+   * @returns {Object} Decay results
+   */
+  async applyDailyDecay() {
+    try {
+      const [results] = await sequelize.query(
+        `UPDATE token_markets
+         SET current_value = current_value * POWER(1 - :decay, DATEDIFF(NOW(), last_updated)),
+             last_updated = NOW()
+         WHERE last_updated < DATE_SUB(NOW(), INTERVAL 1 DAY)`,
+        { replacements: { decay: DAILY_DECAY_RATE } }
+      );
+
+      return {
+        success: true,
+        message: `Applied daily decay to ${(results && results.affectedRows) || 0} stale markets`
+      };
+    } catch (error) {
+      return {
+        success: false,
+        message: error.message
+      };
+    }
+  }
+
   /**
    * Simulate market movements
    * This would typically be called by a cron job
@@ -13,34 +45,47 @@ class MarketSimulationService {
     try {
       const markets = await TokenMarket.findAll({ transaction: t });
       const results = [];
-      
+      const updatedRows = [];
+      const now = new Date();
+
       for (const market of markets) {
         // Generate random movement based on market factors
         const volatility = this.calculateVolatility(market.institutionCode);
         const marketSentiment = this.calculateMarketSentiment();
         const randomFactor = this.getRandomFactor();
-        
+
         // Calculate price change percentage
         // Limited to a realistic range (e.g., -5% to +5%)
         let priceChangePercentage = (volatility * marketSentiment * randomFactor);
         priceChangePercentage = Math.max(-5, Math.min(5, priceChangePercentage));
-        
+
         // Apply price change
-        const newValue = market.currentValue * (1 + (priceChangePercentage / 100));
-        
-        // Update market value
-        market.currentValue = newValue;
-        market.lastUpdated = new Date();
-        await market.save({ transaction: t });
-        
+        const oldValue = market.currentValue;
+        const newValue = oldValue * (1 + (priceChangePercentage / 100));
+
+        // Queue the market update for the batched write below
+        updatedRows.push({
+          ...market.get({ plain: true }),
+          currentValue: newValue,
+          lastUpdated: now
+        });
+
         results.push({
           institutionCode: market.institutionCode,
-          oldValue: market.currentValue,
+          oldValue,
           newValue,
           priceChangePercentage
         });
       }
-      
+
+      // Flush every price change in one upsert instead of a row at a time
+      if (updatedRows.length > 0) {
+        await TokenMarket.bulkCreate(updatedRows, {
+          updateOnDuplicate: ['currentValue', 'lastUpdated'],
+          transaction: t
+        });
+      }
+
       await t.commit();
       
       return {
@@ -277,20 +322,24 @@ class MarketSimulationService {
       
       const markets = await TokenMarket.findAll({ transaction: t });
       const results = [];
-      
+      const updatedRows = [];
+      const now = new Date();
+
       for (const market of markets) {
         // Get reputation factor for this institution
         const repFactor = reputationFactors[market.institutionCode] || reputationFactors.DEFAULT;
-        
+
         // Apply reputation factor to token value
         const oldValue = market.currentValue;
         const newValue = oldValue * repFactor.factor;
-        
-        // Update market
-        market.currentValue = newValue;
-        market.lastUpdated = new Date();
-        await market.save({ transaction: t });
-        
+
+        // Queue the market update for the batched write below
+        updatedRows.push({
+          ...market.get({ plain: true }),
+          currentValue: newValue,
+          lastUpdated: now
+        });
+
         // Record the change
         results.push({
           institutionCode: market.institutionCode,
@@ -300,7 +349,15 @@ class MarketSimulationService {
           reason: repFactor.reason
         });
       }
-      
+
+      // Flush every reputation adjustment in one upsert
+      if (updatedRows.length > 0) {
+        await TokenMarket.bulkCreate(updatedRows, {
+          updateOnDuplicate: ['currentValue', 'lastUpdated'],
+          transaction: t
+        });
+      }
+
       await t.commit();
       
       return {
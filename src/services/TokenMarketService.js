@@ -124,6 +124,7 @@ class TokenMarketService {
         walletId: wallet.id,
         transactionType,
         amount,
+        tokenCode: institutionCode,
         fee,
         status: 'completed',
         metadata: {
@@ -172,8 +173,10 @@ class TokenMarketService {
         };
       }
       
-      // Get transaction history for price chart
+      // Get transaction history for price chart; plain rows, no model
+      // instances, since the data is only reshaped for the chart
       const recentTransactions = await Transaction.findAll({
+        attributes: ['createdAt', 'tokenPrice'],
         where: {
           tokenCode: institutionCode,
           transactionType: {
@@ -181,7 +184,8 @@ class TokenMarketService {
           }
         },
         order: [['createdAt', 'DESC']],
-        limit: 50
+        limit: 50,
+        raw: true
       });
       
       // Format price chart data
@@ -189,7 +193,28 @@ class TokenMarketService {
         timestamp: tx.createdAt,
         price: tx.tokenPrice || 0
       })).reverse();
-      
+
+      // Aggregate 24h volumes server-side so the DB returns three scalars
+      // instead of materializing every transaction row
+      const dayAgo = new Date(Date.now() - 24 * 60 * 60 * 1000);
+      const [volumes] = await Transaction.findAll({
+        attributes: [
+          [sequelize.fn('SUM', sequelize.col('amount')), 'totalVolume'],
+          [sequelize.fn('SUM', sequelize.literal("CASE WHEN transaction_type = 'buy' THEN amount ELSE 0 END")), 'buyVolume'],
+          [sequelize.fn('SUM', sequelize.literal("CASE WHEN transaction_type = 'sell' THEN amount ELSE 0 END")), 'sellVolume']
+        ],
+        where: {
+          tokenCode: institutionCode,
+          transactionType: {
+            [Op.in]: ['buy', 'sell', 'swap']
+          },
+          createdAt: {
+            [Op.gte]: dayAgo
+          }
+        },
+        raw: true
+      });
+
       // Calculate market stats
       const marketStats = {
         institutionCode: tokenMarket.institutionCode,
@@ -198,6 +223,9 @@ class TokenMarketService {
         currentValue: tokenMarket.currentValue,
         change24h: tokenMarket.change24h,
         volume24h: tokenMarket.volume24h,
+        buyVolume24h: parseFloat(volumes.buyVolume) || 0,
+        sellVolume24h: parseFloat(volumes.sellVolume) || 0,
+        totalVolume24h: parseFloat(volumes.totalVolume) || 0,
         marketCap: tokenMarket.marketCap,
         circulatingSupply: tokenMarket.circulatingSupply,
         totalSupply: tokenMarket.totalSupply,
@@ -332,51 +360,72 @@ class TokenMarketService {
       
       const now = new Date();
       const yesterday = new Date(now.getTime() - (24 * 60 * 60 * 1000));
-      
-      // Update each token market
-      for (const tokenMarket of tokenMarkets) {
-        // Get 24h volume from transactions
-        const volume24h = await Transaction.sum('amount', {
-          where: {
-            tokenCode: tokenMarket.institutionCode,
-            transactionType: {
-              [Op.in]: ['buy', 'sell', 'swap']
-            },
-            createdAt: {
-              [Op.gte]: yesterday
-            }
-          },
-          transaction: t
-        }) || 0;
-        
-        // Get previous day's value from transactions
-        const oldestTransaction = await Transaction.findOne({
-          where: {
-            tokenCode: tokenMarket.institutionCode,
-            transactionType: {
-              [Op.in]: ['buy', 'sell', 'swap']
-            },
-            createdAt: {
-              [Op.between]: [yesterday, now]
-            }
+
+      // Aggregate 24h volume for every token in one grouped query
+      // instead of issuing a SUM per market
+      const volumeRows = await Transaction.findAll({
+        attributes: [
+          'tokenCode',
+          [sequelize.fn('SUM', sequelize.col('amount')), 'volume']
+        ],
+        where: {
+          transactionType: {
+            [Op.in]: ['buy', 'sell', 'swap']
           },
-          order: [['createdAt', 'ASC']],
+          createdAt: {
+            [Op.gte]: yesterday
+          }
+        },
+        group: ['tokenCode'],
+        raw: true,
+        transaction: t
+      });
+
+      const volumeByToken = new Map(
+        volumeRows.map(row => [row.tokenCode, parseFloat(row.volume) || 0])
+      );
+
+      // Likewise resolve each token's oldest 24h price in a single query
+      const [oldestPriceRows] = await sequelize.query(
+        `SELECT tx.token_code AS tokenCode, tx.token_price AS tokenPrice
+         FROM transactions tx
+         INNER JOIN (
+           SELECT token_code, MIN(created_at) AS first_at
+           FROM transactions
+           WHERE transaction_type IN ('buy', 'sell', 'swap')
+             AND created_at BETWEEN :yesterday AND :now
+           GROUP BY token_code
+         ) firsts
+           ON firsts.token_code = tx.token_code
+          AND firsts.first_at = tx.created_at
+         WHERE tx.transaction_type IN ('buy', 'sell', 'swap')`,
+        {
+          replacements: { yesterday, now },
           transaction: t
-        });
-        
+        }
+      );
+
+      const oldestPriceByToken = new Map(
+        oldestPriceRows.map(row => [row.tokenCode, parseFloat(row.tokenPrice)])
+      );
+
+      // Update each token market from the pre-aggregated maps
+      for (const tokenMarket of tokenMarkets) {
+        const volume24h = volumeByToken.get(tokenMarket.institutionCode) || 0;
+
         // Calculate 24h change
         let change24h = 0;
-        if (oldestTransaction && oldestTransaction.tokenPrice) {
-          const oldValue = oldestTransaction.tokenPrice;
+        const oldValue = oldestPriceByToken.get(tokenMarket.institutionCode);
+        if (oldValue) {
           change24h = ((tokenMarket.currentValue - oldValue) / oldValue) * 100;
         }
-        
+
         // Update token market
         tokenMarket.volume24h = volume24h;
         tokenMarket.change24h = change24h;
         tokenMarket.marketCap = tokenMarket.currentValue * tokenMarket.circulatingSupply;
         tokenMarket.lastUpdated = now;
-        
+
         await tokenMarket.save({ transaction: t });
       }
       
@@ -459,8 +508,18 @@ class TokenMarketService {
         transaction: t
       });
       
+      // Fetch every candidate wallet up front instead of one query per
+      // user inside the loop
+      const wallets = await Wallet.findAll({
+        where: {
+          userId: { [Op.in]: users.map(user => user.id) }
+        },
+        transaction: t
+      });
+      const walletsByUserId = new Map(wallets.map(wallet => [wallet.userId, wallet]));
+
       let processedCount = 0;
-      
+
       for (const user of users) {
         if (!user.metadata || !user.metadata.challenges) {
           continue;
@@ -484,16 +543,13 @@ class TokenMarketService {
           const endDate = new Date(challenge.endDate);
           
           if (now > endDate) {
-            // Get user's wallet
-            const wallet = await Wallet.findOne({
-              where: { userId: user.id },
-              transaction: t
-            });
-            
+            // Get user's wallet from the pre-fetched map
+            const wallet = walletsByUserId.get(user.id);
+
             if (wallet) {
               // Return staked tokens to user's balance if not already claimed
               const stakingAmount = challenge.stakingAmount || 0;
-              wallet.balance += stakingAmount;
+              wallet.nairaBalance += stakingAmount;
               await wallet.save({ transaction: t });
               
               // Create transaction record
@@ -502,6 +558,7 @@ class TokenMarketService {
                 walletId: wallet.id,
                 transactionType: 'unstake',
                 amount: stakingAmount,
+                tokenCode: challenge.institutionCode,
                 fee: 0,
                 status: 'completed',
                 metadata: {